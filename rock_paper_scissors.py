@@ -14,6 +14,7 @@ match against the computer opponent.  Key features include:
 
 # ── IMPORTS & LOCALE SETUP ─────────────────────────────────────────────────────
 import curses       # for character-cell display handling
+import curses.panel # for stacking the banner, score and art windows
 import random       # for computer’s random choice
 import time         # for countdown delays
 import locale       # to handle wide/Unicode characters in user input
@@ -61,6 +62,18 @@ ASCII_ART = {
 
 CHOICES = ["rock", "paper", "scissors"]  # Valid moves
 
+# Round outcome codes returned by decide_winner()
+TIE, USER_WINS, COMP_WINS = 0, 1, 2
+
+# Indexed by outcome code: (message, colour pair, user points, computer points)
+RESULT_TABLE = (
+    ("It's a tie!",               3, 0, 0),
+    ("You win this round!",       2, 1, 0),
+    ("Computer wins this round!", 1, 0, 1),
+)
+
+REVEAL_MS = 1000  # How long both choices stay up before the result (any key skips)
+
 # ── DRAWING HELPERS ────────────────────────────────────────────────────────────
 def print_centered(stdscr, y, text, color_pair, bold=False):
     """
@@ -84,55 +97,121 @@ def print_centered(stdscr, y, text, color_pair, bold=False):
         # Ignoring errors when window is too small
         pass
 
-def print_ascii_art(stdscr, start_y, art_lines, color_pair):
+def build_art_panels(stdscr, start_y, color_pair):
     """
-    Render multi-line ASCII art centered horizontally.
+    Pre-render the ASCII art of every choice into its own hidden panel.
+
+    Each line stays centered on the screen exactly as before, so revealing a
+    choice is just a show() of the matching panel and hide() takes it away
+    again without redrawing anything underneath.
 
     Args:
         stdscr        : the curses window
         start_y (int) : top row for the art
-        art_lines (list[str]): lines of ASCII art
         color_pair (int): curses color pair for the art
+
+    Returns:
+        dict[str, panel]: one hidden panel per entry of CHOICES
     """
     h, w = stdscr.getmaxyx()
-    for i, line in enumerate(art_lines):
-        x = max(0, min(w - len(line), (w - len(line)) // 2))
-        try:
-            stdscr.addstr(start_y + i, x, line, curses.color_pair(color_pair))
-        except curses.error:
-            pass
-
-def print_title(stdscr):
+    panels = {}
+    for choice in CHOICES:
+        art_lines = ASCII_ART[choice]
+        art_w = max(len(line) for line in art_lines)
+        left = max(0, (w - art_w) // 2)
+        win = curses.newwin(len(art_lines), min(art_w + 1, w - left),
+                            min(start_y, h - 1), left)
+        for i, line in enumerate(art_lines):
+            x = max(0, min(w - len(line), (w - len(line)) // 2))
+            try:
+                win.addstr(i, max(0, x - left), line, curses.color_pair(color_pair))
+            except curses.error:
+                pass
+        panel = curses.panel.new_panel(win)
+        panel.hide()
+        panels[choice] = panel
+    return panels
+
+def build_title_panel(stdscr):
     """
-    Display the ASCII_TITLE banner at the top of the screen.
+    Render the ASCII_TITLE banner once into a panel at the top of the screen.
+
+    The banner never changes, so the panel stack keeps it on screen from here
+    on without any per-frame drawing.
+
+    Args:
+        stdscr : the curses window
+
+    Returns:
+        panel: the banner panel
     """
     h, w = stdscr.getmaxyx()
+    title_w = max(len(line) for line in ASCII_TITLE)
+    x = max(0, (w - title_w) // 2)
+    # One spare column so writing the last cell of the last row doesn't fail
+    win = curses.newwin(min(len(ASCII_TITLE), h), min(title_w + 1, w - x), 0, x)
     for i, line in enumerate(ASCII_TITLE):
-        x = max(0, min(w - len(line), (w - len(line)) // 2))
         try:
-            stdscr.addstr(i, x, line, curses.color_pair(2) | curses.A_BOLD)
+            win.addstr(i, 0, line, curses.color_pair(2) | curses.A_BOLD)
         except curses.error:
             pass
+    return curses.panel.new_panel(win)
 
-def print_score(stdscr, name, user_score, comp_score):
+def format_scores(name, user_score, comp_score):
     """
-    Show the current score in the top-right corner.
+    Build the score strings shown during a match.
+
+    Scores only change once per round, so main() calls this after each
+    result and reuses the strings for every redraw in between.
 
     Args:
-        stdscr      : the curses window
-        name (str)  : player’s name
+        name (str)       : player’s name
         user_score (int) : player’s score
         comp_score (int) : computer’s score
+
+    Returns:
+        tuple[str, str]: (corner score text, full score line)
     """
-    h, w = stdscr.getmaxyx()
     score_text = f"{name}: {user_score}   AI: {comp_score}"
+    return score_text, f"Score — {score_text}"
+
+def print_score(stdscr, score_panel, score_text):
+    """
+    Show the current score in the top-right corner.
+
+    Only needed when the score changes; the panel keeps it on screen otherwise.
+
+    Args:
+        stdscr           : the curses window
+        score_panel      : one-line panel holding the score
+        score_text (str) : pre-formatted score from format_scores()
+    """
+    h, w = stdscr.getmaxyx()
     y = 1
     x = max(0, w - len(score_text) - 2)
+    win = score_panel.window()
     try:
-        stdscr.addstr(y, x, score_text, curses.color_pair(5) | curses.A_BOLD)
+        win.resize(1, min(len(score_text) + 1, w - x))
+        score_panel.move(y, x)
+        win.erase()
+        win.addstr(0, 0, score_text, curses.color_pair(5) | curses.A_BOLD)
     except curses.error:
         pass
 
+def present(stdscr):
+    """
+    Push everything drawn for the current frame to the terminal in one go.
+
+    All drawing helpers only touch curses' virtual screen; update_panels()
+    composites the panel stack (stdscr at the bottom, then banner, score and
+    art) and a single doupdate() emits only the cells that changed.
+
+    Args:
+        stdscr : the curses window
+    """
+    curses.panel.update_panels()
+    curses.doupdate()
+
 # ── INPUT HELPERS ──────────────────────────────────────────────────────────────
 def prompt_name(stdscr, row):
     """
@@ -148,7 +227,7 @@ def prompt_name(stdscr, row):
     prompt = "Enter your name: "
     curses.echo()
     print_centered(stdscr, row, prompt, 5, bold=True)
-    stdscr.refresh()
+    present(stdscr)
     h, w = stdscr.getmaxyx()
     col = min(w - 1, (w - len(prompt)) // 2 + len(prompt))
     name = stdscr.getstr(row, col, 20).decode(code).strip()
@@ -172,7 +251,7 @@ def get_user_choice(stdscr, row, name):
         stdscr.move(row, 0)
         stdscr.clrtoeol()
         print_centered(stdscr, row, prompt, 5)
-        stdscr.refresh()
+        present(stdscr)
         c = stdscr.getch()
         if c == 27:  # ESC key
             return None
@@ -192,11 +271,11 @@ def countdown(stdscr, row):
         stdscr.move(row, 0)
         stdscr.clrtoeol()
         print_centered(stdscr, row, f"{i}...", 3, bold=True)
-        stdscr.refresh()
+        present(stdscr)
         time.sleep(1)
     stdscr.move(row, 0)
     stdscr.clrtoeol()
-    stdscr.refresh()
+    present(stdscr)
 
 # ── GAME LOGIC ────────────────────────────────────────────────────────────────
 def decide_winner(user, comp):
@@ -208,12 +287,11 @@ def decide_winner(user, comp):
         comp (str): computer’s choice
 
     Returns:
-        "user" | "computer" | "tie"
+        int: TIE, USER_WINS or COMP_WINS (an index into RESULT_TABLE)
     """
-    if user == comp:
-        return "tie"
-    wins = {"rock": "scissors", "scissors": "paper", "paper": "rock"}
-    return "user" if wins[user] == comp else "computer"
+    # In CHOICES order each move beats the one before it (cyclically), so
+    # the index difference mod 3 is 0 for a tie, 1 if the user wins, 2 if not
+    return (CHOICES.index(user) - CHOICES.index(comp)) % 3
 
 def main(stdscr):
     """
@@ -236,10 +314,19 @@ def main(stdscr):
     title_h = len(ASCII_TITLE)          # height of banner
     art_h   = len(ASCII_ART["rock"])    # height of rock art
 
+    # Panel stack: stdscr at the bottom for prompts and messages, the static
+    # banner and score above it, and the pre-rendered art toggled per round.
+    # background and title_panel are never read again, but the references must
+    # stay: curses drops a panel from the stack once it is garbage-collected.
+    background  = curses.panel.new_panel(stdscr)
+    title_panel = build_title_panel(stdscr)
+    score_panel = curses.panel.new_panel(curses.newwin(1, 1, 1, 0))
+    user_art = build_art_panels(stdscr, title_h + 3, 4)
+    comp_art = build_art_panels(stdscr, title_h + 3 + art_h + 5, 5)
+
     # 1) Prompt for player name
-    stdscr.clear()
-    print_title(stdscr)
-    print_score(stdscr, "…", 0, 0)      # placeholder score
+    stdscr.erase()
+    print_score(stdscr, score_panel, format_scores("…", 0, 0)[0])  # placeholder score
     name = prompt_name(stdscr, title_h + 1)
     time.sleep(0.3)
 
@@ -247,11 +334,11 @@ def main(stdscr):
     user_score = comp_score = 0
     rounds     = 5
     needed     = rounds // 2 + 1
+    score_text, full_score_text = format_scores(name, user_score, comp_score)
+    print_score(stdscr, score_panel, score_text)
 
     for rnd in range(1, rounds + 1):
-        stdscr.clear()
-        print_title(stdscr)
-        print_score(stdscr, name, user_score, comp_score)
+        stdscr.erase()
 
         # Round header
         print_centered(stdscr, title_h + 1,
@@ -269,57 +356,51 @@ def main(stdscr):
         comp_choice = random.choice(CHOICES)
 
         # d) Display both choices with ASCII art
-        stdscr.clear()
-        print_title(stdscr)
-        print_score(stdscr, name, user_score, comp_score)
+        stdscr.erase()
 
         print_centered(stdscr, title_h + 1,
                        f"{name} chose: {user_choice.upper()}", 4, bold=True)
-        print_ascii_art(stdscr, title_h + 3, ASCII_ART[user_choice], 4)
+        user_art[user_choice].show()
 
         print_centered(stdscr, title_h + 3 + art_h + 1,
                        "VERSUS", 3, bold=True)
 
         print_centered(stdscr, title_h + 3 + art_h + 3,
                        f"Computer chose: {comp_choice.upper()}", 5, bold=True)
-        print_ascii_art(stdscr, title_h + 3 + art_h + 5,
-                        ASCII_ART[comp_choice], 5)
+        comp_art[comp_choice].show()
 
-        stdscr.refresh()
-        time.sleep(1)
+        present(stdscr)
+        # Hold the reveal for REVEAL_MS; any key skips ahead, ESC quits
+        stdscr.timeout(REVEAL_MS)
+        c = stdscr.getch()
+        stdscr.timeout(-1)
+        if c == 27:  # ESC key
+            return
 
         # e) Decide winner and update score
         result = decide_winner(user_choice, comp_choice)
-        if result == "user":
-            msg = "You win this round!"
-            user_score += 1
-            col = 2
-        elif result == "computer":
-            msg = "Computer wins this round!"
-            comp_score += 1
-            col = 1
-        else:
-            msg = "It's a tie!"
-            col = 3
+        msg, col, user_pts, comp_pts = RESULT_TABLE[result]
+        user_score += user_pts
+        comp_score += comp_pts
+        score_text, full_score_text = format_scores(name, user_score, comp_score)
+        print_score(stdscr, score_panel, score_text)
 
         # f) Show round result and wait for key
         res_y = title_h + 3 + art_h * 2 + 6
         print_centered(stdscr, res_y, msg, col, bold=True)
-        print_centered(stdscr, res_y + 2,
-                       f"Score — {name}: {user_score}   AI: {comp_score}",
-                       5, bold=True)
+        print_centered(stdscr, res_y + 2, full_score_text, 5, bold=True)
         print_centered(stdscr, res_y + 4, "Press any key to continue…", 5)
-        stdscr.refresh()
+        present(stdscr)
         stdscr.getch()
+        user_art[user_choice].hide()
+        comp_art[comp_choice].hide()
 
         # Early exit if match decided
         if user_score == needed or comp_score == needed:
             break
 
     # ── Final match summary ───────────────────────────────────────────────
-    stdscr.clear()
-    print_title(stdscr)
-    print_score(stdscr, name, user_score, comp_score)
+    stdscr.erase()
 
     if user_score > comp_score:
         final = "CONGRATULATIONS! You won the match!"
@@ -336,7 +417,7 @@ def main(stdscr):
                    f"Final Score — {name}: {user_score}   AI: {comp_score}",
                    5, bold=True)
     print_centered(stdscr, title_h + 6, "Press any key to exit…", 5)
-    stdscr.refresh()
+    present(stdscr)
     stdscr.getch()
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ The game allows players to:
 
 The functions are:
 1. draw_window(): Renders the game window with current balance, last result, and messages.
+   Text surfaces are reused through _cached_render() while their strings don't change.
 2. get_user_input() : Handles user input for betting and balance management.
 3. spin_wheel() : Simulates spinning the roulette wheel and calculates winnings or losses.
 4. ask_next_round() : Prompts the player to continue or exit the game.
@@ -40,11 +41,9 @@ GREEN = (0, 128, 0)
 FONT = pygame.font.SysFont('arial', 24)
 BIG_FONT = pygame.font.SysFont('arial', 36)
 
-# Define roulette numbers and colors
-ROULETTE_NUMBERS = list(range(0, 37))
-ROULETTE_COLORS = {0: GREEN}
-for num in range(1, 37):
-    ROULETTE_COLORS[num] = RED if num % 2 == 1 else BLACK
+# Define roulette colors, indexed by pocket number (0-36)
+ROULETTE_COLORS = tuple(GREEN if num == 0 else (RED if num % 2 == 1 else BLACK)
+                        for num in range(37))
 
 # Game state
 balance = 0
@@ -57,22 +56,41 @@ message = ""
 MIN_BET = 10
 PAYOUT = 35
 
+# Rendered text surfaces, keyed by (text, font, color)
+_text_cache = {}
+TEXT_CACHE_SIZE = 64
+
+
+def _cached_render(font, text, color):
+    # Rasterising text is the expensive part of a frame, so keep the surface
+    # for each string and only render strings we haven't seen yet
+    key = (text, id(font), color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            _text_cache.clear()
+        surface = font.render(text, True, color)
+        _text_cache[key] = surface
+    return surface
+
 
 def draw_window():
     win.fill(WHITE)
     # Balance display
-    bal_txt = FONT.render(f"Balance: {balance} coins", True, BLACK)
+    bal_txt = _cached_render(FONT, f"Balance: {balance} coins", BLACK)
     win.blit(bal_txt, (50, 50))
 
     # Last result display
     if result_number is not None:
-        res_txt = BIG_FONT.render(f"Last Result: {result_number}", True, ROULETTE_COLORS[result_number])
+        res_txt = _cached_render(BIG_FONT, f"Last Result: {result_number}", ROULETTE_COLORS[result_number])
         win.blit(res_txt, (WIDTH // 2 - res_txt.get_width() // 2, HEIGHT // 2 - res_txt.get_height() // 2))
 
     # Message display
-    msg_txt = FONT.render(message, True, RED)
+    msg_txt = _cached_render(FONT, message, RED)
     win.blit(msg_txt, (50, 100))
 
+    # Let the OS know the window is still alive before showing the frame
+    pygame.event.pump()
     pygame.display.flip()
 
 
@@ -123,7 +141,7 @@ def get_user_input():
 def spin_wheel():
     global balance, result_number, message
 
-    result_number = random.choice(ROULETTE_NUMBERS)
+    result_number = random.randrange(37)
 
     if bet_number == result_number:
         winnings = bet_amount * PAYOUT
@@ -161,24 +179,20 @@ def main():
         except ValueError:
             print("Please enter a valid number.")
 
-    clock = pygame.time.Clock()
     running = True
 
     while running:
         get_user_input()
         spin_wheel()
 
-        # Run one frame to show result
+        # The window only changes after a spin, so draw it once per round;
+        # the rest of the time is spent waiting on input() anyway
         draw_window()
 
-        pygame.time.delay(1000)
-
         print(f"\nYour balance: {balance} coins")
         if not ask_next_round():
             running = False
 
-        clock.tick(30)
-
     pygame.quit()
     return "exit"
 
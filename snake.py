@@ -17,9 +17,12 @@ These functions are
 1. _start_screen: displays the game banner and instructions, waits for SPACE or ENTER to start.
 2. _ask_walls: asks whether walls are solid or wrapped, returns True/False.
 3. _game: main game loop, handles snake movement, food generation, and collision detection.
-4. _new_food: generates a new food position not occupied by the snake.
-5. _is_opposite: checks if two direction vectors are opposite.
-6. _game_over: displays the game over screen with the final score and asks if the player wants to play again.
+   _banner_ops: lays out the banner lines once for the current width.
+   _step: moves the snake one cell and reports growth or a crash.
+4. _draw_board: draws the walls, food and snake in full (once per game).
+5. _new_food: generates a new food position not occupied by the snake.
+6. _is_opposite: checks if two direction vectors are opposite.
+7. _game_over: displays the game over screen with the final score and asks if the player wants to play again.
 
 
 """
@@ -31,7 +34,9 @@ These functions are
 
 import curses
 import os
+from collections import deque
 import random
+import re
 import sys
 import time
 from pathlib import Path
@@ -44,6 +49,14 @@ YELLOW = "\033[33m"
 CYAN   = "\033[36m"
 RED    = "\033[31m"
 
+# Synchronized-output mode: the terminal holds the screen while a frame is
+# being written and shows it in one go (ignored by terminals without support).
+# Only sent to a real terminal outside Windows: PDCurses draws through the
+# console API there, and the bytes would show up as text.
+SYNC_BEGIN = b"\033[?2026h"
+SYNC_END   = b"\033[?2026l"
+SYNC_OUTPUT = os.name != "nt" and sys.stdout.isatty()
+
 ASCII_SNAKE = [
     "╔════════════════════════════════════════╗",
     "║              S  N  A  K  E             ║",
@@ -133,9 +146,32 @@ KEY_DIR = {
 
 PLAY_AGAIN = False  # set in _game_over() and read by main()
 
+# Board rows are rendered into bytearrays and written in runs of equal colour.
+# _CELL_PAIR maps each cell character to its colour pair number (walls and
+# empty cells share one, so a plain row is a single run) and _RUN finds the runs.
+_CELL_PAIR = bytes.maketrans(b"# O@*", b"\x03\x03\x01\x02\x04")
+_RUN = re.compile(rb"(.)\1*", re.DOTALL)
+_WALL_ROW = b"#" * (BOARD_W + 2)                 # top and bottom border
+_SIDE_ROW = b"#" + b" " * BOARD_W + b"#"         # empty board row
+
+# The snake's body is a deque of board indices (y * BOARD_W + x), head last;
+# _step reports what happened to the tail with a cell index or one of these.
+_GREW = -1      # the head reached food, so the tail stays put
+_CRASHED = -2   # the head hit a wall or the snake itself
+
+# Food placement draws from its own generator; binding randrange once skips
+# the module-level wrapper on every probe.
+_rng = random.Random()
+_randrange = _rng.randrange
+
 # ── Core game loop inside curses wrapper ──────────────────────────────────────
 def _game(stdscr: "curses._CursesWindow") -> None:
     curses.curs_set(0)
+    # The cursor is hidden, so don't spend escape codes moving it back after
+    # each update, and never scroll or insert/delete to patch a few cells
+    stdscr.leaveok(True)
+    stdscr.idlok(False)
+    stdscr.idcok(False)
     stdscr.nodelay(True)
     stdscr.keypad(True)
 
@@ -146,6 +182,13 @@ def _game(stdscr: "curses._CursesWindow") -> None:
     curses.init_pair(3, curses.COLOR_CYAN,   -1)   # walls / banner
     curses.init_pair(4, curses.COLOR_RED,    -1)   # food
     curses.init_pair(5, curses.COLOR_WHITE,  -1)   # score text
+    # Attribute values used while drawing, computed once
+    attr_wall   = curses.color_pair(3)
+    attr_body   = curses.color_pair(1)
+    attr_head   = curses.color_pair(2) | curses.A_BOLD
+    attr_food   = curses.color_pair(4)
+    attr_score  = curses.color_pair(5) | curses.A_BOLD
+    attr_banner = curses.color_pair(3) | curses.A_BOLD
 
     if not _start_screen(stdscr):
         return
@@ -153,13 +196,17 @@ def _game(stdscr: "curses._CursesWindow") -> None:
     stdscr.nodelay(True)   # resume non‑blocking input for the gameplay loop
 
     # Set up initial game state.
-    # Initial snake: two cells in middle
-    snake = [(BOARD_H // 2, BOARD_W // 2 - 1),
-             (BOARD_H // 2, BOARD_W // 2)]
+    # Initial snake: two cells in middle, as board indices with the head last
+    start = (BOARD_H // 2) * BOARD_W + BOARD_W // 2
+    snake = deque([start - 1, start])
+    # Occupancy grid (one byte per cell, row-major) kept in sync with `snake`
+    occ = bytearray(BOARD_H * BOARD_W)
+    occ[start - 1] = occ[start] = 1
     direction = KEY_DIR[curses.KEY_RIGHT]
-    food = _new_food(snake)
+    food = _new_food(occ)
 
     score = 0
+    prev_score = -1                     # score currently shown on screen
     last_key = curses.KEY_RIGHT
     banner_lines = ASCII_SNAKE
     frame_delay = BASE_DELAY
@@ -181,95 +228,222 @@ def _game(stdscr: "curses._CursesWindow") -> None:
         stdscr.getch()
         return
 
+    # Draw the banner and the full board once; the loop below only patches
+    # the few cells that change each frame instead of erasing and redrawing.
+    left = (max_x - (BOARD_W + 2)) // 2
+    banner_ops = _banner_ops(left, attr_banner)
+    stdscr.erase()
+    for op in banner_ops:
+        stdscr.addstr(*op)
+    board_attr = {1: attr_body, 2: attr_head, 3: attr_wall, 4: attr_food}
+    _draw_board(stdscr, top, left, snake, food, board_attr)
+
+    # Screen position of board cell (0, 0) and of the score line
+    oy, ox = top + 1, left + 1
+    score_y = top + BOARD_H + 3
+
+    # Bound methods used every frame, looked up once
+    addch, addstr = stdscr.addch, stdscr.addstr
+    getch, refresh, timeout = stdscr.getch, stdscr.refresh, stdscr.timeout
+    # curses buffers its own output and writes it once per refresh; our sync
+    # markers skip the text layer and go straight to the binary stream.
+    # Bound only when the markers are sent at all (see SYNC_OUTPUT).
+    if SYNC_OUTPUT:
+        out_write, out_flush = sys.stdout.buffer.write, sys.stdout.buffer.flush
+
+    # Frames are paced against a deadline so drawing time doesn't stretch them
+    perf_counter = time.perf_counter
+    next_tick = perf_counter()
     while True:
-        # Handle user input: arrow keys and ESC.
+        # Handle user input while waiting for the next tick: getch blocks for
+        # at most the rest of the frame and wakes up as soon as a key arrives,
+        # so presses are picked up right away instead of after a sleep. The
+        # snake only moves once the deadline is reached; the most recent
+        # valid arrow wins.
+        next_direction = direction
+        resized = False
+        key = -1
         try:
-            key = stdscr.getch()
+            while True:
+                remaining = next_tick - perf_counter()
+                if remaining <= 0:
+                    break
+                timeout(max(1, int(remaining * 1000)))
+                key = getch()
+                if key == 27:
+                    break
+                if key == curses.KEY_RESIZE:
+                    resized = True
+                elif key in KEY_DIR and not _is_opposite(KEY_DIR[key], direction):
+                    next_direction = KEY_DIR[key]
+                    last_key = key
         except KeyboardInterrupt:
             break
         if key == 27:                      # ESC
             break
-        if key in KEY_DIR and not _is_opposite(KEY_DIR[key], direction):
-            direction = KEY_DIR[key]
-            last_key = key
-
-        # Determine the snake's next head position, with wrap-around if enabled.
-        if walls_solid:
-            ny = snake[-1][0] + direction[0]
-            nx = snake[-1][1] + direction[1]
-        else:
-            ny = (snake[-1][0] + direction[0]) % BOARD_H
-            nx = (snake[-1][1] + direction[1]) % BOARD_W
-        new_head = (ny, nx)
+        direction = next_direction
 
         # The current food item occupies a 2x2 block.
-        food_cells = [(food[0], food[1]), (food[0]+1, food[1]), (food[0], food[1]+1), (food[0]+1, food[1]+1)]
+        f = food[0] * BOARD_W + food[1]
+        food_cells = (f, f + 1, f + BOARD_W, f + BOARD_W + 1)
 
-        # Check if the snake hits itself or (if solid) a wall.
-        if walls_solid and (ny < 0 or ny >= BOARD_H or nx < 0 or nx >= BOARD_W):
-            _game_over(stdscr, score)
-            return
-        if new_head in snake:
+        # Move the snake; stop if it hits itself or (if solid) a wall.
+        vacated = _step(snake, occ, *direction, walls_solid, food_cells)
+        if vacated == _CRASHED:
             _game_over(stdscr, score)
             return
 
-        # Add new head; check if food is eaten, update score and delay.
-        snake.append(new_head)
-        if new_head in food_cells:
+        # Check if food is eaten, update score and delay.
+        grew = vacated == _GREW
+        if grew:
             score += 1
-            food = _new_food(snake)
+            food = _new_food(occ)
+            if food is None:               # no room left for food
+                _game_over(stdscr, score)
+                return
             frame_delay = max(MIN_DELAY, frame_delay - SPEEDUP)
+
+        # Patch only the cells that changed: the vacated tail cell, the old
+        # head (now body), the new head, and the food if it moved.
+        if grew:
+            for cell in food_cells:
+                if not occ[cell]:
+                    cy, cx = divmod(cell, BOARD_W)
+                    addch(oy + cy, ox + cx, ' ')
+            fy, fx = food
+            for cy, cx in ((fy, fx), (fy+1, fx), (fy, fx+1), (fy+1, fx+1)):
+                addch(oy + cy, ox + cx, '*', attr_food)
         else:
-            snake.pop(0)
-
-        # Render the game board and elements to the terminal.
-        stdscr.erase()
-
-        left = (max_x - (BOARD_W + 2)) // 2
-
-        # banner
-        for idx, line in enumerate(ASCII_SNAKE):
-            stdscr.addstr(idx, left + (BOARD_W + 2 - len(line)) // 2,
-                          line, curses.color_pair(3) | curses.A_BOLD)
-
-        # border
-        top = len(ASCII_SNAKE)
-        wall_attr = curses.color_pair(3)
-        for x in range(BOARD_W + 2):
-            stdscr.addch(top, left + x, '#', wall_attr)
-            stdscr.addch(top + BOARD_H + 1, left + x, '#', wall_attr)
-        for y in range(1, BOARD_H + 1):
-            stdscr.addch(top + y, left, '#', wall_attr)
-            stdscr.addch(top + y, left + BOARD_W + 1, '#', wall_attr)
-
-        # food
-        fy, fx = food
-        food_cells = [(fy, fx), (fy+1, fx), (fy, fx+1), (fy+1, fx+1)]
-        for cy, cx in food_cells:
-            stdscr.addch(top + 1 + cy, left + 1 + cx, '*', curses.color_pair(4))
-
-        # snake
-        for y, x in snake[:-1]:
-            stdscr.addch(top + 1 + y, left + 1 + x, 'O', curses.color_pair(1))
-        hy, hx = snake[-1]
-        stdscr.addch(top + 1 + hy, left + 1 + hx, '@', curses.color_pair(2) | curses.A_BOLD)
-
-        # score line
-        stdscr.addstr(top + BOARD_H + 3, left,
-                      f"Score: {score}", curses.color_pair(5) | curses.A_BOLD)
+            ty, tx = divmod(vacated, BOARD_W)
+            addch(oy + ty, ox + tx, ' ')
+        py, px = divmod(snake[-2], BOARD_W)
+        addch(oy + py, ox + px, 'O', attr_body)
+        ny, nx = divmod(snake[-1], BOARD_W)
+        addch(oy + ny, ox + nx, '@', attr_head)
+
+        # The screen is only cleared when the terminal was resized: re-centre
+        # and redraw everything from the current game state.
+        if resized:
+            max_y, max_x = stdscr.getmaxyx()
+            left = max(0, (max_x - (BOARD_W + 2)) // 2)
+            ox = left + 1
+            banner_ops = _banner_ops(left, attr_banner)
+            stdscr.erase()
+            for op in banner_ops:
+                addstr(*op)
+            _draw_board(stdscr, top, left, snake, food, board_attr)
+            prev_score = -1                # the erase wiped the score line
+
+        # score line, rewritten only when it changes
+        if score != prev_score:
+            addstr(score_y, left, f"Score: {score}", attr_score)
+            prev_score = score
+
+        if SYNC_OUTPUT:
+            out_write(SYNC_BEGIN)
+            out_flush()
+        refresh()
+        if SYNC_OUTPUT:
+            out_write(SYNC_END)
+            out_flush()
+
+        # Schedule the next tick; if this frame overran it, start the next
+        # frame right away and resync rather than trying to catch up.
+        next_tick += frame_delay
+        if next_tick <= perf_counter():
+            next_tick = perf_counter()
+
+def _banner_ops(left: int, attr: int) -> list[tuple[int, int, str, int]]:
+    """
+    Lay out the ASCII_SNAKE banner centred over a board whose left border is
+    at column `left`. Returns the (row, col, line, attr) arguments for addstr,
+    so the layout is computed once and only redone when the terminal resizes.
+    """
+    return [(row, left + (BOARD_W + 2 - len(line)) // 2, line, attr)
+            for row, line in enumerate(ASCII_SNAKE)]
 
-        stdscr.refresh()
-        time.sleep(frame_delay)
+def _step(snake: deque, occ: bytearray, dy: int, dx: int,
+          walls_solid: bool, food_cells: tuple[int, ...]) -> int:
+    """
+    Move the snake one cell in direction (dy, dx).
 
-def _new_food(snake: list[tuple[int,int]]) -> tuple[int,int]:
-    """Return a random board cell not occupied by the snake."""
-    # Randomly find a 2x2 area not occupied by the snake.
-    while True:
-        y = random.randrange(BOARD_H - 1)
-        x = random.randrange(BOARD_W - 1)
-        square = [(y, x), (y+1, x), (y, x+1), (y+1, x+1)]
-        if all(cell not in snake for cell in square):
-            return (y, x)
+    `snake` holds board indices with the head last and `occ` is the
+    occupancy grid; both are updated in place. Returns the board index of the
+    tail cell that was vacated, _GREW if the head entered `food_cells`, or
+    _CRASHED (with nothing changed) if the move hits a wall or the snake.
+    """
+    y, x = divmod(snake[-1], BOARD_W)
+    y += dy
+    x += dx
+    if walls_solid:
+        if y < 0 or y >= BOARD_H or x < 0 or x >= BOARD_W:
+            return _CRASHED
+    else:
+        y %= BOARD_H
+        x %= BOARD_W
+    cell = y * BOARD_W + x
+    if occ[cell]:
+        return _CRASHED
+
+    snake.append(cell)
+    occ[cell] = 1
+    if cell in food_cells:
+        return _GREW
+    vacated = snake.popleft()
+    occ[vacated] = 0
+    return vacated
+
+def _draw_board(stdscr, top: int, left: int, snake: deque,
+                food: tuple[int,int], run_attr: dict[int,int]) -> None:
+    """
+    Draw the whole board (walls, food and snake) with its top-left corner at
+    (top, left). `snake` lists the board indices of the snake, head last.
+    Each row is built in a bytearray and written with one addstr per run of
+    equal colour; `run_attr` maps colour pair numbers to the
+    attributes to draw them with.
+    """
+    stdscr.addstr(top, left, _WALL_ROW, run_attr[3])
+    stdscr.addstr(top + BOARD_H + 1, left, _WALL_ROW, run_attr[3])
+
+    rows = [bytearray(_SIDE_ROW) for _ in range(BOARD_H)]
+    fy, fx = food
+    rows[fy][1 + fx:3 + fx] = b"**"
+    rows[fy + 1][1 + fx:3 + fx] = b"**"
+    for cell in snake:
+        y, x = divmod(cell, BOARD_W)
+        rows[y][1 + x] = ord("O")
+    hy, hx = divmod(snake[-1], BOARD_W)
+    rows[hy][1 + hx] = ord("@")
+
+    addstr = stdscr.addstr
+    for y, row in enumerate(rows, top + 1):
+        pairs = row.translate(_CELL_PAIR)
+        for run in _RUN.finditer(pairs):
+            start, end = run.span()
+            addstr(y, left + start, bytes(row[start:end]), run_attr[pairs[start]])
+
+def _new_food(occ: bytearray) -> tuple[int,int] | None:
+    """
+    Return the top-left cell of a random 2x2 area not occupied by the snake.
+    `occ` is the occupancy grid from _game. Returns None if no area is free.
+    """
+    # While the board is mostly empty, random probing finds a spot quickly.
+    if occ.count(1) * 2 < len(occ):
+        rr, bh, bw = _randrange, BOARD_H - 1, BOARD_W - 1
+        while True:
+            y = rr(bh)
+            x = rr(bw)
+            i = y * BOARD_W + x
+            if not (occ[i] or occ[i + 1] or occ[i + BOARD_W] or occ[i + BOARD_W + 1]):
+                return (y, x)
+
+    # Otherwise list every free 2x2 area once and pick one of them.
+    free = [(y, x)
+            for y in range(BOARD_H - 1)
+            for x in range(BOARD_W - 1)
+            if not (occ[y * BOARD_W + x] or occ[y * BOARD_W + x + 1]
+                    or occ[(y + 1) * BOARD_W + x] or occ[(y + 1) * BOARD_W + x + 1])]
+    return _rng.choice(free) if free else None
 
 def _is_opposite(a: tuple[int,int], b: tuple[int,int]) -> bool:
     """True if direction `a` is the exact opposite of `b`."""
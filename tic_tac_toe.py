@@ -9,21 +9,28 @@
 # to determine the best move, and it can also make random moves to add unpredictability.
 # The game keeps track of scores and displays the current state of the board after each move.
 # The game also includes an opening book loaded from a JSON file, which contains pre-calculated optimal moves
-# for various board states. If the board state is not found in the book, the AI falls back to the Minimax algorithm.
+# for every board state the AI can face (regenerate it with tools/build_book.py). If the book is missing,
+# the AI falls back to the Minimax algorithm.
 
 # List of functions:
 # 1. clear(): Clears the console screen.
-# 2. no_possible_win(board): Checks if there are no possible winning conditions left on the board.
-# 3. print_board(board, score, players, show_numbers): Displays the current state of the board with player names and scores.
-# 4. check_win(board, player): Checks if the given player has achieved a win on the board.
-# 5. board_full(board): Checks if the board is full (no empty cells).
-# 6. get_move(board, player): Prompts the player to enter their move.
-# 7. minimax(board, depth, is_maximizing, alpha, beta): Implements the Minimax algorithm with alpha-beta pruning.
+#    center_pad(width, length): Returns the (cached) padding that centers a line of the given length.
+#    enable_ansi(): Turns on ANSI escape sequences on Windows consoles (used by clear()).
+# 2. terminal_state(x, o): Classifies a board as won by 'x' or 'o', a 'tie' (full, or no win possible), or still 'open'.
+# 3. print_board(x, o, score, players, show_numbers, width): Displays the current state of the board with player names and scores.
+# 4. check_win(bits): Checks if a player's stones form a winning line.
+# 5. board_full(x, o): Checks if the board is full (no empty cells).
+# 6. get_move(x, o, player): Prompts the player to enter their move.
+# 7. minimax(x, o, depth, is_maximizing, alpha, beta): Implements the Minimax algorithm with alpha-beta pruning
+#    and a transposition table keyed by the exact position.
 # PS: This function did not work that well, so I used a JSON file with pre-calculated moves.
 #    to determine the best move for the AI.
-# 8. load_opening_book(): Loads the opening book from a JSON file.
-# 9. best_move(board): Determines the best move for the AI using the Minimax algorithm.
-# 10. ai_move(board): Determines the AI's move on the board.
+# 8. load_opening_book(): Loads the opening book from a JSON file, keyed by position (x | o << 9).
+# 9. best_move(x, o): Determines the best move for the AI using the Minimax algorithm.
+# 10. ai_move(x, o): Determines the AI's move on the board.
+#     board_key(x, o): Encodes a board as an opening-book key.
+#     canonical(key): Maps a book key to its representative under the board's symmetries.
+#     random_empty(x, o): Picks a random empty cell.
 # 11. play_round(players, single_mode, score, show_numbers): Plays a single round of Tic-Tac-Toe.
 # 12. game_loop(single_mode): Main game loop for playing rounds.
 # 13. main_menu(): Displays the main menu and handles user input to navigate between modes.
@@ -31,19 +38,19 @@
 
 
 # Import necessary libraries
-import os # For clearing the console screen
+import os # For detecting Windows and the old-console fallback of clear()
 import shutil # For getting terminal size
 import time # For adding delays in the game
 import random # For generating random moves for the AI --> see AI_RANDOMNESS
 import json # For loading the opening book of optimal moves from a JSON file
+import sys # For writing the board to the terminal in one go
+from functools import lru_cache # For memoizing board predicates
 
-# ── Opening-book of optimal moves ─────────────────────────────────────────
-BOOK = {}
+from pathlib import Path # For locating the opening book next to this file
 try:
-    from pathlib import Path
-    BOOK = json.load(Path(__file__).with_name("tictactoe_book.json").open())
-except (FileNotFoundError, json.JSONDecodeError):
-    print("Warning: opening‑book not found; AI will use Minimax only.")
+    import orjson # Optional: faster decoding of the opening book; json is used when it's not installed
+except ImportError:
+    orjson = None
 
 # Constants
 
@@ -52,161 +59,241 @@ except (FileNotFoundError, json.JSONDecodeError):
 # A value of 0.2 means there is a 20% chance the AI will make a random move.
 AI_RANDOMNESS = 0.2  # 20% chance to make a random move
 
-
-# it clears the console screen
-def clear():
-    # Clear the console screen based on the operating system
-    os.system('cls' if os.name == 'nt' else 'clear') 
-
-# check if no winning condition is possible by using a table of winning conditions
-def no_possible_win(board):
+# Bitboards
+# The board is stored as two 9-bit ints, x and o, one per player: bit k (k = row*3 + col)
+# is set when that player has a stone in the cell. Cell k is shown to the players as k+1.
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # Rows
+    0b001001001, 0b010010010, 0b100100100,  # Columns
+    0b100010001, 0b001010100,               # Diagonals
+)
+FULL_BOARD = 0x1FF  # All nine cells taken
+# Every one of the 512 stone patterns of a single player that contains a winning line
+WIN_SET = frozenset(bits for bits in range(FULL_BOARD + 1)
+                    if any(bits & mask == mask for mask in WIN_MASKS))
+
+# Symmetries of the board (4 rotations x 2 reflections) as permutations of the cell indices 0-8:
+# the board transformed by p has the cell p[k] of the original board at index k.
+SYMS = [
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # Identity
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # Mirror left-right
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # Rotate 90°
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # Mirror on the main diagonal
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # Rotate 180°
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # Mirror top-bottom
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # Rotate 270°
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # Mirror on the anti-diagonal
+]
+
+# Search constants
+# Scores are ints in -10..10, so INF only has to be larger than any of them; keeping every
+# value an int leaves minimax pure integer arithmetic.
+INF = 10_000
+# Order in which moves are tried: center, corners, then edges.
+PRIORITY = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+# PRIORITY with cell k moved to the front, for each k (see the best-move hint in TT below)
+HINTED_ORDER = tuple((k,) + tuple(m for m in PRIORITY if m != k) for k in range(9))
+
+# Transposition table: position (x | o << 9) -> (value, flag, best_idx), filled by minimax().
+# best_idx is the cell of the best move found (None for finished games) and is tried first next time.
+# Depth is counted in stones on the board, so a stored value is the same whatever search reached it.
+TT = {}
+EXACT, LOWERBOUND, UPPERBOUND = 0, 1, 2
+
+# The AI's first move, looked up by the 'X' bitboard (the AI is 'O', so at most one 'X' is down):
+# the center, or a corner if 'X' took the center. These are perfect-play replies.
+FIRST_REPLY = {0: 4}
+FIRST_REPLY.update({1 << k: 0 if k == 4 else 4 for k in range(9)})
+
+# Board drawing: width of a cell and the separator line between rows
+CELL_WIDTH = 7
+_SEP_LINE = "+" + "+".join(["=" * CELL_WIDTH] * 3) + "+"
+# Left padding that centers a line, keyed by (terminal width, line length)
+_pad_cache = {}
+
+# ANSI escape sequence that moves the cursor to the top-left corner and clears the screen
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+
+# it lets the Windows console understand ANSI escape sequences
+def enable_ansi():
     """
-    Check if there is no possible winning condition left on the board.
-
-    Args:
-        board (list of list of str): A 3x3 tic-tac-toe board where each cell contains 'X', 'O', or ''.
+    Enable ANSI escape processing on the Windows console (other terminals support it already).
 
     Returns:
-        bool: True if no winning condition is possible, False otherwise.
+        bool: True if ANSI escape sequences can be used, False on consoles that don't support them.
     """
-    # Define all possible winning conditions
-    win_cond = [
-        (0,0,0,1,0,2), (1,0,1,1,1,2), (2,0,2,1,2,2),  # Rows
-        (0,0,1,0,2,0), (0,1,1,1,2,1), (0,2,1,2,2,2),  # Columns
-        (0,0,1,1,2,2), (0,2,1,1,2,0)                 # Diagonals
-    ]
-    # Check if any line has both 'X' and 'O', making it impossible to win
-    for x1, y1, x2, y2, x3, y3 in win_cond:
-        line = [board[x1][y1], board[x2][y2], board[x3][y3]]
-        if not ('X' in line and 'O' in line):
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
             return False
-    return True
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING (0x0004); fails on consoles older than Windows 10
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+ANSI_ENABLED = enable_ansi()  # Checked once when the game is loaded
+
+
+# it clears the console screen
+def clear():
+    # Write the escape sequence directly instead of starting a 'cls'/'clear' process;
+    # only consoles without ANSI support still fall back to 'cls'
+    if ANSI_ENABLED:
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
+    else:
+        os.system('cls')
+
+# padding to center a line in the terminal
+def center_pad(width, length):
+    # The same few widths and lengths come up on every redraw, so build each padding string once
+    pad = _pad_cache.get((width, length))
+    if pad is None:
+        pad = _pad_cache[(width, length)] = " " * ((width - length) // 2)
+    return pad
 
 # Function to print the game board
-def print_board(board, score, players, show_numbers):
+def print_board(x, o, score, players, show_numbers, width):
     """
     Clears the console and prints the current state of the tic-tac-toe board with player names and scores.
 
     Args:
-        board (list of list of str): The 3x3 game board. Each cell contains 'X', 'O', or ' '.
+        x (int): Bitboard of the 'X' stones.
+        o (int): Bitboard of the 'O' stones.
         score (dict): A dictionary with players' names as keys and their current scores as values.
         players (list of str): List containing names of the two players. Expected order: [player1, player2].
         show_numbers (bool): If True, empty cells are annotated with their corresponding cell number (1-9).
+        width (int): The terminal width in columns, used to center the output.
 
     Returns:
         None
     """
     clear()  # Clear the console screen
     
-    # Get the terminal width to format the output centrally
-    width = shutil.get_terminal_size().columns
-    
     # Create header and score display strings
     header = f"{players[0]} vs {players[1]}"
     score_line = f"Score: {players[0]} {score[players[0]]} - {score[players[1]]} {players[1]}"
     
-    # Print the header centered and the score right-aligned
-    print(header.center(width))
-    print(score_line.rjust(width))
-    print("\n")
+    # The whole frame is collected here and written to the terminal at once
+    # Header centered and the score right-aligned
+    out = [header.center(width), score_line.rjust(width), "", ""]
     
     # Prepare the display board with numbers in empty cells if show_numbers is True
     display = []
     for i in range(3):
         row = []
         for j in range(3):
-            # If showing numbers and cell is empty (' '), display cell number starting at 1
-            if show_numbers and board[i][j] == ' ':
+            bit = 1 << (i*3+j)
+            if x & bit:
+                row.append('X')
+            elif o & bit:
+                row.append('O')
+            # If showing numbers and cell is empty, display cell number starting at 1
+            elif show_numbers:
                 row.append(f"({i*3+j+1})")
             else:
-                row.append(board[i][j])
+                row.append(' ')
         display.append(row)
     
-    # Define cell width and separator line for board display
-    cell_width = 7
-    sep_line = "+" + "+".join(["=" * cell_width] * 3) + "+"
-    
-    # Print each row of the board with appropriate formatting
+    # Add each row of the board with appropriate formatting
     for row in display:
         # Center each item in the cell
-        line = "|" + "|".join(item.center(cell_width) for item in row) + "|"
-        pad = " " * ((width - len(line)) // 2)
-        print(pad + sep_line)
-        print(pad + line)
+        line = "|" + "|".join(item.center(CELL_WIDTH) for item in row) + "|"
+        pad = center_pad(width, len(line))
+        out.append(pad + _SEP_LINE)
+        out.append(pad + line)
     
-    # Print the bottom separator line
-    pad = " " * ((width - len(sep_line)) // 2)
-    print(pad + sep_line)
+    # Add the bottom separator line
+    out.append(center_pad(width, len(_SEP_LINE)) + _SEP_LINE)
     
-    # Display additional help message
-    print("\nType 'esc' to return to menu at any time.\n")
+    # Add the help message, then write the frame
+    out += ["", "Type 'esc' to return to menu at any time.", ""]
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
 # check if a player has won
-def check_win(board, player):
+def check_win(bits):
     """
-    Check if the given player has achieved a win on the tic-tac-toe board.
+    Check if a player has achieved a win on the tic-tac-toe board.
 
     Args:
-        board (list of list of str): A 3x3 tic-tac-toe board. Each cell contains 'X', 'O', or ' '.
-        player (str): The player's symbol ('X' or 'O') to check for a win.
+        bits (int): Bitboard of the player's stones (x or o).
 
     Returns:
         bool: True if the player has won, False otherwise.
     """
-    # we have eight possible winning conditions as tuples of cell indices.
-    win_cond = [
-        (0,0, 0,1, 0,2),  # Top row
-        (1,0, 1,1, 1,2),  # Middle row
-        (2,0, 2,1, 2,2),  # Bottom row
-        (0,0, 1,0, 2,0),  # Left column
-        (0,1, 1,1, 2,1),  # Middle column
-        (0,2, 1,2, 2,2),  # Right column
-        (0,0, 1,1, 2,2),  # Diagonal from top-left to bottom-right
-        (0,2, 1,1, 2,0)   # Diagonal from top-right to bottom-left
-    ]
-    
-    # Iterate through each winning condition
-    for x1, y1, x2, y2, x3, y3 in win_cond:
-        # Check if all three cells in the current winning condition have the player's symbol.
-        if board[x1][y1] == board[x2][y2] == board[x3][y3] == player:
-            return True  # Winning condition met
-    
-    # If none of the winning conditions are met, return False.
-    return False
+    # A player wins when all three cells of one of the eight winning lines are theirs;
+    # WIN_SET lists all such patterns, so this is a single set lookup.
+    return bits in WIN_SET
 
 # Function to check if the board is full
-def board_full(board):
+def board_full(x, o):
     """
     Check if the tic-tac-toe board is full.
 
     Args:
-        board (list of list of str): The 3x3 game board.
+        x (int): Bitboard of the 'X' stones.
+        o (int): Bitboard of the 'O' stones.
 
     Returns:
         bool: True if the board is full, False otherwise.
     """
-    return all(cell != ' ' for row in board for cell in row)
+    return x | o == FULL_BOARD
+
+# Function to tell whether (and how) a game is over
+@lru_cache(maxsize=None)
+def terminal_state(x, o):
+    """
+    Classify the board in a single pass over the winning lines.
+
+    Args:
+        x (int): Bitboard of the 'X' stones.
+        o (int): Bitboard of the 'O' stones.
+
+    Returns:
+        str: 'x' or 'o' if that player has won, 'tie' if the board is full or no line can be
+             completed any more, and 'open' otherwise.
+    """
+    blocked = 0  # Lines holding stones of both players
+    for mask in WIN_MASKS:
+        xm, om = x & mask, o & mask
+        if xm == mask:
+            return 'x'
+        if om == mask:
+            return 'o'
+        if xm and om:
+            blocked += 1
+    if blocked == len(WIN_MASKS) or x | o == FULL_BOARD:
+        return 'tie'
+    return 'open'
 
 # Function to get a player's move
-def get_move(board, player):
+def get_move(x, o, player):
     """
     Prompt the player to enter their move on the tic-tac-toe board.
 
     Args:
-        board (list of list of str): The 3x3 game board. Each cell contains 'X', 'O', or ' '.
+        x (int): Bitboard of the 'X' stones.
+        o (int): Bitboard of the 'O' stones.
         player (str): The name or symbol of the player making the move.
 
     Returns:
-        tuple: A tuple (row, column) representing the player's chosen cell, or 'esc' if the player exits.
+        int: The index (0-8) of the player's chosen cell, or 'esc' if the player exits.
     """
     while True:
         move = input(f"{player}, enter your move (1-9): ")
         if move.lower() == 'esc':
             return 'esc'
         if move.isdigit() and 1 <= int(move) <= 9:
-            r, c = divmod(int(move) - 1, 3) # Convert move to row and column indices
-            if board[r][c] == ' ': # Check if the cell is empty
-                return r, c 
+            k = int(move) - 1 # Convert move to a cell index
+            if not (x | o) >> k & 1: # Check if the cell is empty
+                return k
             else:
                 print("Cell is taken!") # Prompt if the cell is already occupied
         else:
@@ -217,65 +304,103 @@ def get_move(board, player):
 # ── Minimax Algorithm with Alpha-Beta Pruning ─────────────────────────────
 
 # Minimax algorithm with alpha-beta pruning. It is still being worked on, but it is not used in the final version of the game.
-def minimax(board, depth, is_maximizing, alpha, beta):
+def minimax(x, o, depth, is_maximizing, alpha, beta):
     """
     Recursively evaluates the tic-tac-toe board using the Minimax algorithm enhanced
     with alpha-beta pruning to determine the best score achievable from a given state.
+    Results are kept in the transposition table TT, so a position reached through a
+    different move order is looked up instead of searched again.
 
     Args:
-        board (list of list of str): The current 3x3 tic-tac-toe board.
-        depth (int): The current recursion depth, used to penalize longer wins.
+        x (int): Bitboard of the 'X' stones.
+        o (int): Bitboard of the 'O' stones.
+        depth (int): The number of stones on the board, used to penalize longer wins.
         is_maximizing (bool): Flag indicating whether we are maximizing (True for 'O')
                               or minimizing (False for 'X') the score.
-        alpha (float): The best already explored option along the path to the root for the maximizer.
-        beta (float): The best already explored option along the path to the root for the minimizer.
+        alpha (int): The best already explored option along the path to the root for the maximizer.
+        beta (int): The best already explored option along the path to the root for the minimizer.
 
     Returns:
         int: The score of the board using evaluation rules. A higher score indicates a more favorable
              outcome for 'O', while a lower score favors 'X'.
     """
+    # Probe the transposition table: an exact value is returned as is,
+    # a bound narrows the window and may cut the search off right away.
+    alpha_orig, beta_orig = alpha, beta
+    h = x | o << 9  # The two bitboards together identify the position exactly
+    hint = None
+    entry = TT.get(h)
+    if entry is not None:
+        value, flag, hint = entry
+        if flag == EXACT:
+            return value
+        if flag == LOWERBOUND and value > alpha:
+            alpha = value
+        elif flag == UPPERBOUND and value < beta:
+            beta = value
+        if alpha >= beta:
+            return value
+
+    state = terminal_state(x, o)
+
     # If AI ('O') wins, return a high positive score, adjusted by depth to prefer faster wins.
-    if check_win(board, 'O'):
+    if state == 'o':
+        TT[h] = (10 - depth, EXACT, None)
         return 10 - depth
 
     # If human ('X') wins, return a high negative score, adjusted by depth to delay losses.
-    if check_win(board, 'X'):
+    if state == 'x':
+        TT[h] = (depth - 10, EXACT, None)
         return depth - 10
 
     # If the board is full (or no moves lead to a win), it's a tie.
-    if board_full(board):
+    if state == 'tie':
+        TT[h] = (0, EXACT, None)
         return 0
 
-    # Prioritized order to check moves: center, corners, then edges.
-    priority = [(1, 1)] + [(0, 0), (0, 2), (2, 0), (2, 2)] + [(0, 1), (1, 0), (1, 2), (2, 1)]
+    occupied = x | o
+    # Try the best move from an earlier search first: it is the most likely to cause a cutoff.
+    moves = PRIORITY if hint is None else HINTED_ORDER[hint]
+    best_k = None
 
     if is_maximizing:
-        max_eval = -float('inf')
+        max_eval = -INF
         # Evaluate moves for AI ('O')
-        for i, j in [(i, j) for i, j in priority if board[i][j] == ' ']:
-            board[i][j] = 'O'  # Try a move
-            # Evaluate resulting board recursively
-            eval = minimax(board, depth + 1, False, alpha, beta)
-            board[i][j] = ' '  # Undo move
-            max_eval = max(max_eval, eval)
+        for k in moves:
+            if occupied >> k & 1:
+                continue
+            # Evaluate the board with the move played recursively
+            eval = minimax(x, o | 1 << k, depth + 1, False, alpha, beta)
+            if eval > max_eval:
+                max_eval, best_k = eval, k
             alpha = max(alpha, eval)  # Update alpha if a better move is found
             if beta <= alpha:
                 # Beta cutoff: stop exploring this branch if minimizer already has a better choice
                 break
-        return max_eval
+        best_eval = max_eval
     else:
-        min_eval = float('inf')
+        min_eval = INF
         # Evaluate moves for human ('X')
-        for i, j in [(i, j) for i, j in priority if board[i][j] == ' ']:
-            board[i][j] = 'X'  # Try a move
-            eval = minimax(board, depth + 1, True, alpha, beta)
-            board[i][j] = ' '  # Undo move
-            min_eval = min(min_eval, eval)
+        for k in moves:
+            if occupied >> k & 1:
+                continue
+            eval = minimax(x | 1 << k, o, depth + 1, True, alpha, beta)
+            if eval < min_eval:
+                min_eval, best_k = eval, k
             beta = min(beta, eval)  # Update beta if a lower score is found
             if beta <= alpha:
                 # Alpha cutoff: stop exploring this branch if maximizer already has a better option
                 break
-        return min_eval
+        best_eval = min_eval
+
+    # Store the result: a value outside the original window is only a bound.
+    if best_eval <= alpha_orig:
+        TT[h] = (best_eval, UPPERBOUND, best_k)
+    elif best_eval >= beta_orig:
+        TT[h] = (best_eval, LOWERBOUND, best_k)
+    else:
+        TT[h] = (best_eval, EXACT, best_k)
+    return best_eval
 
 
 
@@ -283,117 +408,199 @@ def minimax(board, depth, is_maximizing, alpha, beta):
 
 
 # Function to determine the best move for the AI
-def best_move(board):
+def best_move(x, o):
     """
     Determines the best move for the AI ('O') using the Minimax algorithm.
 
     Args:
-        board (list of list of str): The current 3x3 tic-tac-toe board.
+        x (int): Bitboard of the 'X' stones.
+        o (int): Bitboard of the 'O' stones.
 
     Returns:
-        tuple: A tuple (row, column) representing the best move for the AI.
+        int: The index (0-8) of the best cell for the AI, or None if the board is full.
     """
-    best_val = -float('inf')  # Initialize the best value to negative infinity
+    best_val = -INF  # Initialize the best value to minus infinity
     best = None  # Initialize the best move as None
-
-    # Prioritized order to check moves: center, corners, then edges
-    priority = [(1, 1)] + [(0, 0), (0, 2), (2, 0), (2, 2)] + [(0, 1), (1, 0), (1, 2), (2, 1)]
+    occupied = x | o
+    depth = occupied.bit_count() + 1  # Stones on the board after our move
 
     # Iterate through all possible moves in the prioritized order
-    for i, j in [(i, j) for i, j in priority if board[i][j] == ' ']:
-        board[i][j] = 'O'  # Try the move
+    for k in PRIORITY:
+        if occupied >> k & 1:
+            continue
         # Evaluate the move using the Minimax algorithm
-        move_val = minimax(board, 0, False, -float('inf'), float('inf'))
-        board[i][j] = ' '  # Undo the move
+        move_val = minimax(x, o | 1 << k, depth, False, -INF, INF)
 
         # Update the best move if the current move has a higher evaluation score
         if move_val > best_val:
             best_val = move_val
-            best = (i, j)
+            best = k
 
     return best  # Return the best move
 
 
 # ── AI Move Function ─────────────────────────────────────────────────────
+# Opening-book key of a board
+def board_key(x, o):
+    """
+    Encode a board as an opening-book key.
+
+    Args:
+        x (int): Bitboard of the 'X' stones.
+        o (int): Bitboard of the 'O' stones.
+
+    Returns:
+        str: The nine cells row by row, with '-' for an empty cell (e.g. "X---O----").
+    """
+    return "".join('X' if x >> k & 1 else 'O' if o >> k & 1 else '-' for k in range(9))
+
+# Representative of a board key under the symmetries of the board
+def canonical(key):
+    """
+    Find the representative of a board key among its 8 rotations and reflections.
+
+    Args:
+        key (str): A board key as returned by board_key().
+
+    Returns:
+        tuple: (canonical_key, p) where canonical_key is the smallest transformed key and p the
+               permutation from SYMS that produced it; index k of the canonical board is cell
+               p[k] of the original board.
+    """
+    return min(("".join([key[k] for k in p]), p) for p in SYMS)
+
+# Random empty cell, picked straight from the bitboards
+def random_empty(x, o):
+    """
+    Pick an empty cell uniformly at random.
+
+    Args:
+        x (int): Bitboard of the 'X' stones.
+        o (int): Bitboard of the 'O' stones.
+
+    Returns:
+        int: The index (0-8) of a random empty cell. The board must not be full.
+    """
+    empty = ~(x | o) & FULL_BOARD
+    n = empty.bit_count()
+    if n == 1:  # Last empty cell: nothing to choose
+        return empty.bit_length() - 1
+    # Drop the lowest empty cells until the chosen one is the lowest left
+    for _ in range(random.randrange(n)):
+        empty &= empty - 1
+    return (empty & -empty).bit_length() - 1
+
 # Function to make the AI's move
-def ai_move(board):
+def ai_move(x, o):
     """
     Determines the AI's move on the tic-tac-toe board.
 
     Args:
-        board (list of list of str): The current 3x3 tic-tac-toe board.
+        x (int): Bitboard of the 'X' stones.
+        o (int): Bitboard of the 'O' stones.
 
     Returns:
-        tuple: A tuple (row, column) representing the AI's chosen cell.
+        int: The index (0-8) of the AI's chosen cell.
     """
     if random.random() < AI_RANDOMNESS: # Introduce randomness in AI moves
         # Random move to add unpredictability
-        return random.choice([(i, j) for i in range(3) for j in range(3) if board[i][j] == ' '])
+        return random_empty(x, o)
     
-    # Generate a key representing the current board state
-    key = "".join(cell if cell != ' ' else '-' for row in board for cell in row)
+    # First move of the round: answer straight from the table, no book key needed
+    if not o and x in FIRST_REPLY:
+        return FIRST_REPLY[x]
     
-    # Check if the current board state exists in the opening book
-    if key in BOOK:
-        idx = BOOK[key]
-        return divmod(idx, 3)  # Convert the index to row and column
+    # The opening book holds the best move for every position the AI can face
+    # (generated by tools/build_book.py), so this is normally a single lookup.
+    idx = BOOK.get(x | o << 9)
+    if idx is not None:
+        return idx
     
-    # Use the Minimax algorithm to determine the best move
-    mv = best_move(board)
-    if mv:
+    # Only reached if the book is missing: use the Minimax algorithm instead
+    mv = best_move(x, o)
+    if mv is not None:
         return mv
     
     # Fallback to a random move if no optimal move is found
-    return random.choice([(i, j) for i in range(3) for j in range(3) if board[i][j] == ' '])
+    return random_empty(x, o)
 
 
 # Load optimal move book from JSON
-# The json file should contain a mapping of board states to optimal moves taken from teh web.
-# The keys are strings representing the board state, and the values are indices of the optimal move.
-# Example: {"-X O O": 4} means the optimal move for the board state "-X O O" is at index 4 (row 1, column 1).
+# The json file contains a mapping of board states to optimal moves, generated by tools/build_book.py.
+# The keys are canonical board keys (see board_key() and canonical()), and the values are indices of the optimal move.
+# Example: {"X---O---X": 1} means the optimal move for the board state "X---O---X" is at index 1 (row 0, column 1).
 def load_opening_book():
     """
     Load the opening book from a JSON file. The file should contain a mapping of board states to optimal moves.
+    Each entry is expanded to all 8 rotations and reflections of its board and keyed by the position
+    x | o << 9, so ai_move() can look a board up without building a key string or canonicalising it.
 
     Returns:
-        dict: A dictionary where keys are strings representing board states and values are indices of optimal moves.
+        dict: A dictionary where keys are positions (x | o << 9) and values are indices of optimal moves.
     """
+    path = Path(__file__).with_name("tictactoe_book.json")
     try:
-        with open(os.path.join(os.path.dirname(__file__), "tictactoe_book.json")) as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print("Warning: tictactoe_book.json not found, falling back to Minimax.")
+        if orjson is not None:
+            book = orjson.loads(path.read_bytes())
+        else:
+            with path.open() as f:
+                book = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):  # orjson's decode error subclasses json's
+        print("Warning: opening‑book not found; AI will use Minimax only.")
         return {}
 
+    positions = {}
+    for key, idx in book.items():
+        for p in SYMS:
+            # In this image, canonical cell k sits at cell p[k]
+            x = o = 0
+            for k, cell in enumerate(key):
+                if cell == 'X':
+                    x |= 1 << p[k]
+                elif cell == 'O':
+                    o |= 1 << p[k]
+            positions[x | o << 9] = p[idx]
+    return positions
+
+# ── Opening-book of optimal moves ─────────────────────────────────────────
+BOOK = load_opening_book()
+
 
 
 # ── Game Logic ──────────────────────────────────────────────────────────
 
 # Function to play a single round of Tic-Tac-Toe
 def play_round(players, single_mode, score, show_numbers):
-    board = [[' ']*3 for _ in range(3)]  # Initialize an empty board
+    x = o = 0  # Initialize an empty board (one bitboard per player)
     turn = 0  # Track the current turn
+    # Get the terminal width once per round to format the output centrally
+    width = shutil.get_terminal_size().columns
     while True:
-        print_board(board, score, players, show_numbers)  # Display the board
+        print_board(x, o, score, players, show_numbers, width)  # Display the board
         current = players[turn%2]  # Determine the current player
         symbol = 'X' if turn%2==0 else 'O'  # Determine the player's symbol
         if single_mode and current=="AI":
             time.sleep(0.5)  # Add a delay for AI moves
-            r,c = ai_move(board)  # Get AI's move
+            k = ai_move(x, o)  # Get AI's move
         else:
-            mv = get_move(board, current)  # Get player's move
+            mv = get_move(x, o, current)  # Get player's move
             if mv=='esc':  # Check if the player wants to exit
                 return 'esc'
-            r,c = mv
-        board[r][c]=symbol  # Update the board with the player's move
-        if check_win(board, symbol):  # Check if the player has won
-            print_board(board, score, players, show_numbers)
+            k = mv
+        # Update the board with the player's move
+        if symbol == 'X':
+            x |= 1 << k
+        else:
+            o |= 1 << k
+        state = terminal_state(x, o)  # Check if the game is over
+        if state in ('x', 'o'):  # The player who just moved has won
+            print_board(x, o, score, players, show_numbers, width)
             print(f"{current} wins!")
             score[current]+=1  # Update the player's score
             time.sleep(1)
             return
-        if board_full(board) or no_possible_win(board):  # Check for a tie
-            print_board(board, score, players, show_numbers)
+        if state == 'tie':  # Board full or no win possible
+            print_board(x, o, score, players, show_numbers, width)
             print("It's a tie!")
             time.sleep(1)
             return
@@ -438,7 +645,7 @@ def game_loop(single_mode):
     
     # Display the final score and determine the winner
     clear()
-    print_board([[' '] * 3] * 3, score, players, show_numbers)
+    print_board(0, 0, score, players, show_numbers, shutil.get_terminal_size().columns)
     print(f"Final: {players[0]} {score[players[0]]} - {score[players[1]]} {players[1]}")
     
     if score[players[0]] > score[players[1]]:
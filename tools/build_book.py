@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Build the Tic-Tac-Toe opening book (tictactoe_book.json).
+
+The book maps every board the AI ('O') can face to its best move, so that
+tic_tac_toe.ai_move() only needs a dictionary lookup at runtime. X always
+moves first, so these are the reachable, unfinished boards with one more
+'X' than 'O'. Rotations and reflections of a board share one entry, stored
+under the board's canonical key (see tic_tac_toe.canonical()).
+
+Keys come from tic_tac_toe.board_key(): the nine cells row by row, with '-'
+for an empty cell. Values are cell indices 0-8 of the canonical board.
+
+Usage:
+    python tools/build_book.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import tic_tac_toe  # noqa: E402  (needs ROOT on sys.path)
+
+
+def build_book():
+    """
+    Walk the whole game tree from the empty board and solve every canonical O-to-move position.
+
+    Returns:
+        dict: Canonical board keys mapped to the index (0-8) of O's best move.
+    """
+    book = {}
+    seen = set()
+
+    def visit(x, o):
+        if (x, o) in seen:
+            return
+        seen.add((x, o))
+        if tic_tac_toe.check_win(x) or tic_tac_toe.check_win(o) or tic_tac_toe.board_full(x, o):
+            return
+        x_to_move = x.bit_count() == o.bit_count()
+        key = tic_tac_toe.board_key(x, o)
+        if not x_to_move and tic_tac_toe.canonical(key)[0] == key:
+            book[key] = tic_tac_toe.best_move(x, o)
+        for k in range(9):
+            if not (x | o) >> k & 1:
+                if x_to_move:
+                    visit(x | 1 << k, o)
+                else:
+                    visit(x, o | 1 << k)
+
+    visit(0, 0)
+    return book
+
+
+def main():
+    book = build_book()
+    path = ROOT / "tictactoe_book.json"
+    with path.open("w") as f:
+        json.dump(book, f)
+    print(f"Wrote {len(book)} positions to {path}")
+
+
+if __name__ == "__main__":
+    main()